@@ -22,39 +22,47 @@ along with this program; if not, see https://www.gnu.org/licenses.
 
 import bpy
 import os
-import bmesh
-import fnmatch
-import mathutils
-from collections import defaultdict
+from functools import partial
+from collections import defaultdict, deque, namedtuple
 from .helpers import (
     is_location_applied,
-    get_top_parent,
-    get_island_texel_densities,
-    get_uv_utilization,
+    get_top_parent_cached,
+    get_uv_stats,
+    get_texel_density_stats,
     get_all_objects_recursive,
     count_uv_islands,
-    get_total_uv_and_face_area,
-    is_uv_layout_stacked,
     is_mesh,
-    has_armature,
+    get_armature,
+    count_unassigned_vertices,
     collection_has_armature,
     get_transform_status,
     has_seams,
     has_uvs,
-    has_textures,
-    ensure_object_mode,
-    is_hero_asset,
-    aaa_mode,
-    find_flipped_faces
+    scan_context,
+    find_flipped_faces,
+    get_vertex_coords,
+    get_topology_data,
+    get_check_executor,
+    get_material_image_nodes
 )
 from .constants import (
     required_maps,
     optional_maps,
     allowed_prefixes,
-    blacklist_patterns,
+    BLACKLIST_RE,
+    ALLOWED_MODIFIER_TYPES,
+    SCANNED_OBJECT_TYPES,
     TEXEL_DENSITY_RANGE,
     TEXEL_DENSITY_MIN_AAA,
     TEXEL_DENSITY_DEVIATION_THRESHOLD,
+    DOUBLE_VERTEX_THRESHOLD,
+    PARALLEL_VERTEX_MIN,
+    PREFETCH_WINDOW,
+    NORMAL_SAMPLE_SIZE,
+)
+from .kernels import (
+    topology_counts,
+    count_double_vertices
 )
 from .texture_checks import (
     check_texture_naming,
@@ -64,11 +72,31 @@ from .texture_checks import (
     detect_map_type_from_node
 )
 
+_REQUIRED_MAPS = frozenset(required_maps)
+_OPTIONAL_MAPS = frozenset(optional_maps)
+
+# Unapplied transform types are tracked as bits and only turned into labels when reported
+_SCALE, _ROTATION, _LOCATION = 1, 2, 4
+_ALL_TRANSFORMS = _SCALE | _ROTATION | _LOCATION
+_TRANSFORM_LABELS = ((_SCALE, "Scale"), (_ROTATION, "Rotation"), (_LOCATION, "Location"))
+_SORTED_TRANSFORM_LABELS = tuple(sorted(_TRANSFORM_LABELS, key=lambda item: item[1]))
+
+def unapplied_transform_mask(scale_applied, rotation_applied, location_applied):
+    mask = 0
+    if not scale_applied:
+        mask |= _SCALE
+    if not rotation_applied:
+        mask |= _ROTATION
+    if not location_applied:
+        mask |= _LOCATION
+    return mask
+
+def transform_labels(mask, labels=_TRANSFORM_LABELS):
+    return ", ".join(name for bit, name in labels if mask & bit)
+
 def check_collection_structure(collection):
     report = []
 
-    ensure_object_mode()
-
     if not collection_has_armature(collection):
         report.append((collection.name, "No armature present", "INFO"))
 
@@ -81,142 +109,140 @@ def check_collection_structure(collection):
 def check_collection_transforms(collection):
     report = []
 
-    ensure_object_mode()
-
-    objects = [obj for obj in get_all_objects_recursive(collection) if obj.type in {'MESH', 'ARMATURE'}]
+    objects = [obj for obj in get_all_objects_recursive(collection) if obj.type in SCANNED_OBJECT_TYPES]
     if not objects:
         report.append((collection.name, "No mesh or armature objects to check", "INFO"))
         return report
 
     report.append((collection.name, f"Checked {len(objects)} objects across nested collections", "INFO"))
 
-    unapplied_types = set()
+    unapplied = 0
+    top_cache = {}
 
-    for obj in objects:
-        top = get_top_parent(obj)
-        scale_applied, rotation_applied, location_applied = get_transform_status(top)
-        if not scale_applied:
-            unapplied_types.add("Scale")
-        if not rotation_applied:
-            unapplied_types.add("Rotation")
-        if not location_applied:
-            unapplied_types.add("Location")
-        
-    if unapplied_types:
-        report.append(("Unapplied Transforms", f"{', '.join(sorted(unapplied_types))}", "ERROR"))
+    # Sibling meshes usually share a root, so each top parent is only tested once
+    for top in {get_top_parent_cached(obj, top_cache) for obj in objects}:
+        unapplied |= unapplied_transform_mask(*get_transform_status(top))
+        if unapplied == _ALL_TRANSFORMS:
+            break
+
+    if unapplied:
+        report.append(("Unapplied Transforms", transform_labels(unapplied, _SORTED_TRANSFORM_LABELS), "ERROR"))
     else:
         report.append(("Transforms Applied", "OK", "INFO"))
 
     return report
 
-def check_counts(obj):
-    mesh = obj.data
+def counts_report(vert_count, face_count, edge_count):
     return [
-        ("Vertex Count", str(len(mesh.vertices)), "INFO"),
-        ("Face Count", str(len(mesh.polygons)), "INFO"),
-        ("Edge Count", str(len(mesh.edges)), "INFO"),
+        ("Vertex Count", str(vert_count), "INFO"),
+        ("Face Count", str(face_count), "INFO"),
+        ("Edge Count", str(edge_count), "INFO"),
     ]
 
-def check_bmesh_topology(obj):
+def check_counts(obj):
     mesh = obj.data
-    bm = bmesh.new()
-    bm.from_mesh(mesh)
-    bm.verts.ensure_lookup_table()
-    bm.edges.ensure_lookup_table()
-    bm.faces.ensure_lookup_table()
+    return counts_report(len(mesh.vertices), len(mesh.polygons), len(mesh.edges))
 
-    ngons = sum(1 for f in bm.faces if len(f.verts) > 4)
-    non_manifold = sum(1 for e in bm.edges if not e.is_manifold)
-    stray_verts = sum(1 for v in bm.verts if not v.link_edges)
-
-    bm.free()
+def topology_report(ngons, non_manifold, stray_verts):
     return [
         ("N-gons", str(ngons), "ERROR" if ngons > 0 else "INFO"),
         ("Non-Manifold Edges", str(non_manifold), "WARNING" if non_manifold > 0 else "INFO"),
         ("Stray Vertices", str(stray_verts), "ERROR" if stray_verts > 0 else "INFO"),
     ]
 
+def check_bmesh_topology(obj):
+    return topology_report(*topology_counts(*get_topology_data(obj.data)))
+
 def check_transforms(obj, settings):
-    scale_applied = all(round(val, 3) == 1.0 for val in obj.scale)
-    rotation_applied = all(round(val, 3) == 0.0 for val in obj.rotation_euler)
-    location_applied = is_location_applied(obj)
+    scale_applied, rotation_applied, _ = get_transform_status(obj)
+    unapplied = unapplied_transform_mask(scale_applied, rotation_applied, is_location_applied(obj))
 
-    if scale_applied and location_applied and rotation_applied:
+    if not unapplied:
         return [("Transforms Applied", "True", "INFO")]
 
-    reasons = []
-    if not scale_applied:
-        reasons.append("Scale")
-    if not rotation_applied:
-        reasons.append("Rotation")
-    if not location_applied:
-        reasons.append("Location")
-
     level = "ERROR"
-    if settings.asset_collection_mode and "Location" in reasons:
-        reasons.remove("Location")
-        if reasons:
-            level = "ERROR"
-        else:
+    if settings.asset_collection_mode and unapplied & _LOCATION:
+        if unapplied == _LOCATION:
             level = "WARNING"
-            reasons.append("Location")
+        else:
+            unapplied &= ~_LOCATION
 
-    return [("Unapplied Transforms", ", ".join(reasons), level)]
+    return [("Unapplied Transforms", transform_labels(unapplied), level)]
 
-def check_flipped_normals(obj):
-    flipped_faces = find_flipped_faces(obj)
+def check_flipped_normals(obj, sample_size=None, bm=None):
+    flipped_faces = find_flipped_faces(obj, sample_size=sample_size, bm=bm)
     return len(flipped_faces)
 
-def check_normals(obj):
-    flipped = check_flipped_normals(obj)
+def check_normals(obj, sample_large=False, bm=None):
+    face_count = len(obj.data.polygons)
+    if sample_large and face_count > NORMAL_SAMPLE_SIZE:
+        flipped = round(check_flipped_normals(obj, NORMAL_SAMPLE_SIZE, bm) * face_count / NORMAL_SAMPLE_SIZE)
+        estimate = " (estimated from sample)"
+    else:
+        flipped = check_flipped_normals(obj, bm=bm)
+        estimate = ""
     if flipped > 0:
-        return [("Normals", f"{flipped} faces appear flipped", "ERROR")]
+        return [("Normals", f"{flipped} faces appear flipped{estimate}", "ERROR")]
     return [("Normals", "No flipped normals detected", "INFO")]
 
-def check_double_vertices(obj, threshold=0.0001):
-    mesh = obj.data
-    bm = bmesh.new()
-    bm.from_mesh(mesh)
-    bm.verts.ensure_lookup_table()
-
-    kd = mathutils.kdtree.KDTree(len(bm.verts))
-    for i, v in enumerate(bm.verts):
-        kd.insert(v.co, i)
-    kd.balance()
-
-    double_count = 0
-    for v in bm.verts:
-        matches = kd.find_range(v.co, threshold)
-        if len(matches) > 1:
-            double_count += 1
-
-    bm.free()
+def double_vertices_report(double_count, threshold):
     if double_count > 0:
-        double_count //= 2
         return [("Double Vertices", f"{double_count} within {threshold}m", "ERROR")]
     return [("Double Vertices: ", "None found", "INFO")]
 
-def check_geometry(obj, settings):
-    report = []
+def check_double_vertices(obj, threshold=DOUBLE_VERTEX_THRESHOLD):
+    coords = get_vertex_coords(obj.data)
+    return double_vertices_report(count_double_vertices(coords, threshold), threshold)
+
+def geometry_kernels(obj, parallel=False):
+    # bpy reads stay on this thread; the NumPy kernels only see the copied arrays
+    mesh = obj.data
+    coords = get_vertex_coords(mesh)
+    topology_data = get_topology_data(mesh)
+
+    if parallel or len(coords) >= PARALLEL_VERTEX_MIN:
+        executor = get_check_executor()
+        topology = executor.submit(topology_counts, *topology_data).result
+        doubles = executor.submit(count_double_vertices, coords, DOUBLE_VERTEX_THRESHOLD).result
+    else:
+        topology = partial(topology_counts, *topology_data)
+        doubles = partial(count_double_vertices, coords, DOUBLE_VERTEX_THRESHOLD)
+
+    return topology_data, topology, doubles
 
-    ensure_object_mode()
+def prefetch_geometry(objects, window=PREFETCH_WINDOW):
+    # Yields (obj, kernels) with the next `window` meshes already read and queued, so their kernels run while
+    # the bpy-bound checks work on the current object without every mesh's arrays being held at once
+    pending = deque()
+    for obj in objects:
+        pending.append((obj, geometry_kernels(obj, parallel=True) if is_mesh(obj) else None))
+        if len(pending) > window:
+            yield pending.popleft()
+    while pending:
+        yield pending.popleft()
 
+def check_geometry(obj, settings, kernels=None, bm=None):
     if not is_mesh(obj):
-        return report
+        return []
 
-    report.extend(check_counts(obj))
-    report.extend(check_bmesh_topology(obj))
-    report.extend(check_transforms(obj, settings))
-    report.extend(check_normals(obj))
-    report.extend(check_double_vertices(obj))
+    topology_data, topology, doubles = kernels or geometry_kernels(obj)
 
-    return report
+    transforms = check_transforms(obj, settings)
+    normals = check_normals(obj, settings.sample_large_meshes, bm)
+
+    loop_totals, _, _, vert_count, edge_count = topology_data
+    return [
+        *counts_report(vert_count, len(loop_totals), edge_count),
+        *topology_report(*topology()),
+        *transforms,
+        *normals,
+        *double_vertices_report(doubles(), DOUBLE_VERTEX_THRESHOLD),
+    ]
 
 def check_object_modifiers(obj):
     report = []
 
-    allowed = {"ARMATURE", "TRIANGULATE", "WEIGHTED_NORMAL"}
-    disallowed = [mod for mod in obj.modifiers if mod.type not in allowed]
+    disallowed = [mod for mod in obj.modifiers if mod.type not in ALLOWED_MODIFIER_TYPES]
     if disallowed:
         for mod in disallowed:
             report.append((f"Modifier: {mod.name}", f"Disallowed type: {mod.type}", "ERROR"))
@@ -228,33 +254,70 @@ def check_object_modifiers(obj):
 
     return report
 
-def check_uvs(obj, multi_object_asset=False):
+MaterialScan = namedtuple("MaterialScan", ("image_nodes", "found_maps", "packed_count", "unpacked_reports"))
+
+def scan_materials(obj, image_node_cache=None):
+    # One walk over the material slots feeds both check_uvs and check_textures
+    image_nodes = {}
+    name_map_types = {}
+    found_maps = set()
+    packed_count = 0
+    unpacked_reports = []
+
+    for mat_slot in obj.material_slots:
+        mat = mat_slot.material
+        if not mat:
+            continue
+
+        for node in get_material_image_nodes(mat, image_node_cache):
+            img = node.image
+            if img not in image_nodes:
+                image_nodes[img] = []
+                name_map_types[img] = get_clean_map_type(img)
+            image_nodes[img].append((mat, node))
+
+            if img.packed_file is not None:
+                packed_count += 1
+            else:
+                unpacked_reports.append(("Textures", f"External texture image ({img.name})", "ERROR"))
+
+            map_type = name_map_types[img] or detect_map_type_from_node(node)
+            if map_type:
+                found_maps.add(map_type)
+
+    return MaterialScan(image_nodes, found_maps, packed_count, unpacked_reports)
+
+def check_uvs(obj, multi_object_asset=False, materials=None, scan=None):
     report = []
 
     if not is_mesh(obj):
         return [("UVs", "Not a mesh object", "INFO")]
 
-    found, packed_count, _ = has_textures(obj)
-    if packed_count == 0:
+    scan = scan or scan_context()
+    if materials is None:
+        materials = scan_materials(obj, scan.image_nodes)
+    if materials.packed_count == 0:
         return [("UVs", "Skipped UV checks (no packed textures detected)", "INFO")]
-    
-    ensure_object_mode()
+
     mesh = obj.data
-    target = 90.0 if aaa_mode() else 80.0
-    pass_threshold = 85.0 if aaa_mode() else 70.0
+    aaa, hero = scan.aaa, scan.hero
+    target = 90.0 if aaa else 80.0
+    pass_threshold = 85.0 if aaa else 70.0
 
     # Unwrap/seams
-    if not has_uvs(obj):
+    uvs_found = has_uvs(obj)
+    if not uvs_found:
         report.append(("UVs", "Mesh not unwrapped", "ERROR"))
     else:
         report.append(("UV Unwrapped", "True", "INFO"))
 
-    if not has_seams(obj):
+    seams_found = has_seams(obj)
+    if not seams_found:
         report.append(("UVs", "Marked Seams: None", "ERROR"))
     else:
         report.append(("UVs", "Marked Seams: Found", "INFO"))
 
-    if not has_uvs:
+    if not uvs_found:
         report.append(("UV Layer", "No active UV layer found", "ERROR"))
         return report
 
@@ -264,7 +327,7 @@ def check_uvs(obj, multi_object_asset=False):
     if uv_islands == 1 and is_simple_mesh:
         report.append(("UV Island Count", f"{uv_islands} island (simple mesh)", "INFO"))
     else:
-        threshold = 200 if is_hero_asset() else 100
+        threshold = 200 if hero else 100
         if uv_islands > threshold:
             report.append(("UV Island Count", f"{uv_islands} islands", "ERROR"))
         elif uv_islands > threshold * 0.75:
@@ -273,7 +336,9 @@ def check_uvs(obj, multi_object_asset=False):
             report.append(("UV Island Count", f"{uv_islands} islands", "INFO"))
 
     # Utilization
-    utilization, overflow, uvs = get_uv_utilization(obj)
+    # Texel density is only needed once the atlas heuristic has ruled out a colour atlas
+    uv_stats = get_uv_stats(obj)
+    utilization, overflow, uvs = uv_stats.utilization, uv_stats.overflow, uv_stats.uvs
 
     if utilization == 0.0 and len(uvs) > 0:
         level = "WARNING" if multi_object_asset else "ERROR"
@@ -290,125 +355,109 @@ def check_uvs(obj, multi_object_asset=False):
         report.append(("UV Space Utilization", f"{utilization}% (too low)", level))
 
     # Color atlas detection
-    texture_map_names = [slot.name for slot in obj.material_slots if slot.material]
-    has_normal = "Normal" in texture_map_names
-    has_roughness = "Roughness" in texture_map_names
+    has_normal = "Normal" in materials.found_maps
+    has_roughness = "Roughness" in materials.found_maps
 
     atlas_score = 0
     if utilization < 15.0: atlas_score += 1
-    unique_uvs = set((round(u, 5), round(v, 5)) for u, v in uvs) if uvs else set()
-    unique_ratio = len(unique_uvs) / len(uvs) if uvs else 0
-    if unique_ratio < 0.1: atlas_score += 1
+    if uv_stats.unique_ratio < 0.1: atlas_score += 1
     if not has_normal: atlas_score += 1
     if not has_roughness: atlas_score += 1
     if uv_islands < 15: atlas_score += 1
-    if not has_seams(obj): atlas_score += 1
+    if not seams_found: atlas_score += 1
 
     is_color_atlas = atlas_score >= 5
     if is_color_atlas:
         report.append(("UV Strategy", f"Color atlas confidence: {atlas_score}/6", "INFO"))
 
     # Texel density
-    if has_uvs and not is_color_atlas:
-        total_uv_area, total_face_area = get_total_uv_and_face_area(obj)
+    if not is_color_atlas:
+        total_uv_area, total_face_area, avg_density, deviation = get_texel_density_stats(mesh, uvs)
         ratio = round(total_uv_area / total_face_area, 2) if total_face_area > 0 else 0
-        avg_density, deviation = get_island_texel_densities(obj)
 
-        passed = ratio >= TEXEL_DENSITY_MIN_AAA if aaa_mode() else TEXEL_DENSITY_RANGE[0] <= ratio <= TEXEL_DENSITY_RANGE[1]
+        passed = ratio >= TEXEL_DENSITY_MIN_AAA if aaa else TEXEL_DENSITY_RANGE[0] <= ratio <= TEXEL_DENSITY_RANGE[1]
         report.append(("Texel Density Ratio", f"{ratio:.2f} px/cm", "INFO" if passed else "WARNING"))
         report.append(("Texel Density Avg", f"{avg_density:.2f}", "INFO"))
         report.append(("Texel Density Deviation", f"{deviation:.2f}", "WARNING" if deviation > TEXEL_DENSITY_DEVIATION_THRESHOLD * avg_density else "INFO"))
 
-        if is_uv_layout_stacked(uvs):
-            level = "WARNING" if is_hero_asset() else "INFO"
+        if uv_stats.stacked:
+            level = "WARNING" if hero else "INFO"
             report.append(("UV Layout", "Majority of UVs are stacked or overlapping", level))
 
         # Smart UV detection
-        smart_uv = uv_islands > 50 and not has_seams(obj)
+        smart_uv = uv_islands > 50 and not seams_found
         poor_density = ratio < 0.5 or deviation > TEXEL_DENSITY_DEVIATION_THRESHOLD * avg_density
-        level = "ERROR" if is_hero_asset() else "WARNING"
+        level = "ERROR" if hero else "WARNING"
 
         if smart_uv and poor_density:
             report.append(("Unwrapping Quality", "Likely Smart UV Project with poor texel density", level))
         elif smart_uv:
             report.append(("Unwrapping Quality", "Likely Smart UV Project", level))
-        elif uv_islands < 2 and not has_seams:
+        elif uv_islands < 2 and not seams_found:
             report.append(("Unwrapping Quality", "Likely default UVs", "ERROR"))
         else:
             report.append(("Unwrapping Quality", "Seams detected, unwrap appears manual", "INFO"))
 
-    if aaa_mode():
+    if aaa:
         report.append(("AAA Target", "UV Utilization should be ~90%", "INFO"))
 
     return report
 
-def check_textures(obj, is_color_atlas=False):
+def check_textures(obj, is_color_atlas=False, materials=None, scan=None):
     report = []
-    used_images = set()
-    found_maps = set()
-    strict = aaa_mode()
 
     if not is_mesh(obj):
         return [("Textures", "Not a mesh object", "INFO")]
-    
-    found, packed_count, unpacked_reports = has_textures(obj)
 
-    if not found:
-        return [("Textures", "No textures found", "ERROR")]
+    if not obj.material_slots:
+        return [("Textures", "No materials assigned", "WARNING")]
 
-    report.extend(unpacked_reports)
+    scan = scan or scan_context()
+    if materials is None:
+        materials = scan_materials(obj, scan.image_nodes)
 
-    if packed_count == 0 and not unpacked_reports:
-        return report
+    if not materials.image_nodes:
+        return [("Textures", "No textures found", "ERROR")]
 
-    for mat_slot in obj.material_slots:
-        mat = mat_slot.material
-        if not mat or not mat.use_nodes:
-            continue
+    strict, hero = scan.aaa, scan.hero
+    found_maps = materials.found_maps
 
-        for node in mat.node_tree.nodes:
-            if node.type != 'TEX_IMAGE' or not node.image:
-                continue
+    report.extend(materials.unpacked_reports)
 
-            img = node.image
-            used_images.add(img)
+    append = report.append
+    extend = report.extend
 
-            if img.packed_file is not None:
-                report.extend(check_texture_naming(img, strict))
-                report.extend(check_texture_resolution(img))
-                if img.source == 'TILED':
-                    tile_count = len(img.tiles)
-                    report.append((f"[{mat.name}] UDIM detected", f"{tile_count} tiles", "INFO"))
+    # Shared images are checked once, however many materials or nodes use them
+    for img, uses in materials.image_nodes.items():
+        packed = img.packed_file is not None
+        if not packed:
+            abs_path = bpy.path.abspath(img.filepath)
+            if not abs_path or not os.path.exists(abs_path):
+                append(("Missing External Texture", img.name, "ERROR"))
             else:
-                abs_path = bpy.path.abspath(img.filepath)
-                if not abs_path or not os.path.exists(abs_path):
-                    report.append(("Missing External Texture", img.name, "ERROR"))
-                else:
-                    report.append(("Unpacked Texture (External)", img.name, "ERROR"))
+                append(("Unpacked Texture (External)", img.name, "ERROR"))
 
-                report.extend(check_texture_naming(img, strict))
-                report.extend(check_texture_resolution(img))
+        extend(check_texture_naming(img, strict))
+        extend(check_texture_resolution(img, hero))
 
-            map_type = get_clean_map_type(img) or detect_map_type_from_node(node)
-            if map_type:
-                found_maps.add(map_type)
-                # print("Added map_type:", map_type, "from image:", img.name)
+        for mat, node in uses:
+            if packed and img.source == 'TILED':
+                append((f"[{mat.name}] UDIM detected", f"{len(img.tiles)} tiles", "INFO"))
 
             if not is_node_connected(node):
-                report.append((f"[{mat.name}] Image node not connected", img.name, "WARNING"))
+                append((f"[{mat.name}] Image node not connected", img.name, "WARNING"))
 
     if not is_color_atlas:
+        # Set differences for the membership test; the report still lists maps in rule order
+        missing_required = _REQUIRED_MAPS - found_maps
         for map_type in required_maps:
-            if map_type not in found_maps:
-                if map_type == "Roughness":
-                    level = "ERROR" if is_hero_asset() else "WARNING"
-                    report.append((f"Missing Texture Map", map_type, level))
-                else:
-                    report.append((f"Missing Texture Map", map_type, "ERROR"))
-        
-        missing_optional = [m for m in optional_maps if m not in found_maps]
+            if map_type in missing_required:
+                level = ("ERROR" if hero else "WARNING") if map_type == "Roughness" else "ERROR"
+                append(("Missing Texture Map", map_type, level))
+
+        missing_optional = _OPTIONAL_MAPS - found_maps
         if missing_optional:
-            report.append((f"Optional Maps", "Missing: " + ", ".join(missing_optional), "WARNING"))
+            append(("Optional Maps", "Missing: " + ", ".join([m for m in optional_maps if m in missing_optional]), "WARNING"))
 
     if found_maps:
         summary = ", ".join(sorted(found_maps))
@@ -416,27 +465,34 @@ def check_textures(obj, is_color_atlas=False):
 
     return report
 
-def check_rigging(obj):
+def check_rigging(obj, armature=None, bm=None):
     report = []
 
-    ensure_object_mode()
-
     if not is_mesh(obj):
         return [("Rigging", "Not a mesh object", "INFO")]
 
-    if not has_armature(obj):
+    if armature is None:
+        armature = get_armature(obj)
+    if not armature:
         return [("Rigging", "No armature linked", "INFO")]
 
-    armature_mod = next((m for m in obj.modifiers if m.type == 'ARMATURE' and m.object), None)
-    armature = armature_mod.object
     bones = armature.data.bones
     pose_bones = armature.pose.bones if armature.pose else []
 
     bone_count = len(bones)
     report.append(("Bone Count", str(bone_count), "INFO" if bone_count > 0 else "ERROR"))
 
-    non_conforming = [b.name for b in bones if not b.name.startswith(allowed_prefixes)]   
-    blacklisted = [b.name for b in bones if any(fnmatch.fnmatch(b.name, pattern) for pattern in blacklist_patterns)]
+    non_conforming = []
+    blacklisted = []
+    hierarchy_ok = True
+    for bone in bones:
+        name = bone.name
+        if not name.startswith(allowed_prefixes):
+            non_conforming.append(name)
+        if BLACKLIST_RE.match(name):
+            blacklisted.append(name)
+        if bone.parent and bone.parent == bone:
+            hierarchy_ok = False
 
     naming_issues = []
     if blacklisted:
@@ -449,10 +505,9 @@ def check_rigging(obj):
     else:
         report.append(("Bone Naming", "OK", "INFO"))
 
-    hierarchy_ok = all(b.parent != b for b in bones if b.parent)
     report.append(("Hierarchy Clean", str(hierarchy_ok), "ERROR" if not hierarchy_ok else "INFO"))
 
-    unassigned = sum(1 for v in obj.data.vertices if not v.groups)
+    unassigned = count_unassigned_vertices(obj.data, bm)
     report.append((f"{obj.name} - Unassigned Verts", str(unassigned), "INFO" if unassigned == 0 else "ERROR"))
 
     has_constraints = any(c for b in pose_bones for c in b.constraints)
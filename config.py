@@ -70,6 +70,11 @@ class uGameSettings(bpy.types.PropertyGroup):
         description="Ignore object location errors for modular or grouped assets",
         default=False
     )
+    sample_large_meshes: bpy.props.BoolProperty(
+        name="Sample Large Meshes",
+        description="Estimate flipped normals from a sample of faces on very dense meshes",
+        default=False
+    )
 
 def register():
     bpy.utils.register_class(uGameSettings)
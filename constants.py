@@ -21,6 +21,7 @@ along with this program; if not, see https://www.gnu.org/licenses.
 '''
 
 import re
+import fnmatch
 
 section_aliases = {
     "Normals": "Geometry",
@@ -59,8 +60,10 @@ section_aliases = {
 
 valid_prefixes = ["T_", "TEX_"]
 
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]')
+
 def normalize_token(s: str) -> str:
-    return re.sub(r'[^a-z0-9]', '', s.lower())
+    return _NON_ALNUM_RE.sub('', s.lower())
 
 required_maps = {
     "Diffuse": {normalize_token(s) for s in {"_c", "_col", "_color", "_bc", "_basecolor", "_base_color", "_albedo", "_d", "_diffuse", "_diff"}},
@@ -90,7 +93,30 @@ blacklist_patterns = {
     "Bone*", "Joint*", "Temp*", "Unnamed*", "Helper*"
 }
 
+# Reverse lookup from suffix token to map type; required maps win over optional ones, as in infer_map_type
+MAP_TYPE_BY_SUFFIX = {
+    suffix: map_type
+    for map_type, suffixes in reversed((*required_maps.items(), *optional_maps.items()))
+    for suffix in suffixes
+}
+MAP_PRIORITY = {map_type: i for i, map_type in enumerate((*required_maps, *optional_maps))}
+MAP_SUFFIX_LENGTHS = tuple(sorted({len(suffix) for suffix in MAP_TYPE_BY_SUFFIX}))
+
+ALLOWED_MODIFIER_TYPES = frozenset({"ARMATURE", "TRIANGULATE", "WEIGHTED_NORMAL"})
+SCANNED_OBJECT_TYPES = frozenset({'MESH', 'ARMATURE'})
+
+def compile_patterns(patterns):
+    # One alternation per pattern list, so a name is matched in a single regex scan
+    return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
+
+BANNED_RE = compile_patterns(banned_patterns)
+BLACKLIST_RE = compile_patterns(blacklist_patterns)
+
 TEXEL_DENSITY_RANGE = (3, 12)
 TEXEL_DENSITY_MIN_AAA = 12
 TEXEL_DENSITY_DEVIATION_THRESHOLD = 0.15
 UV_UTILIZATION_MIN = 90
+DOUBLE_VERTEX_THRESHOLD = 0.0001
+PARALLEL_VERTEX_MIN = 50000
+PREFETCH_WINDOW = 2
+NORMAL_SAMPLE_SIZE = 100000
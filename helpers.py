@@ -22,31 +22,60 @@ along with this program; if not, see https://www.gnu.org/licenses.
 
 import bpy
 import bmesh
+import os
+import re
+import functools
+import numpy as np
+from collections import defaultdict, namedtuple
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from .constants import section_aliases
-from mathutils import Vector
+from .kernels import (
+    flipped_face_indices,
+    polygon_uv_areas,
+    unique_uv_ratio,
+    uv_utilization,
+    texel_density_spread,
+    count_seam_islands
+)
+
+_check_executor = None
 
 def is_location_applied(obj):
-    has_parent = obj.parent is not None
-    is_zero = all(val == 0.0 for val in obj.location)
-    return has_parent or is_zero
+    return obj.parent is not None or not any(obj.location)
 
 def get_top_parent(obj):
     while obj.parent:
         obj = obj.parent
     return obj
 
+def get_top_parent_cached(obj, cache):
+    # Every object walked on the way up is cached, so shared chains are only walked once
+    path = []
+    while obj.as_pointer() not in cache:
+        path.append(obj)
+        if not obj.parent:
+            cache[obj.as_pointer()] = obj
+            break
+        obj = obj.parent
+    top = cache[obj.as_pointer()]
+    for walked in path:
+        cache[walked.as_pointer()] = top
+    return top
+
+_IDENTITY_TRANSFORM = np.array((1.0, 1.0, 1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0))
+TRANSFORM_TOLERANCE = 5e-4
+
 def get_transform_status(obj):
-    scale_applied = all(round(val, 3) == 1.0 for val in obj.scale)
-    rotation_applied = all(round(val, 3) == 0.0 for val in obj.rotation_euler)
-    location_applied = all(round(val, 3) == 0.0 for val in obj.location)
-    return scale_applied, rotation_applied, location_applied
+    values = np.array((*obj.scale, *obj.rotation_euler, *obj.location))
+    applied = (np.abs(values - _IDENTITY_TRANSFORM) < TRANSFORM_TOLERANCE).reshape(3, 3).all(axis=1)
+    return bool(applied[0]), bool(applied[1]), bool(applied[2])
 
 def is_color_atlas(obj, utilization, uvs, has_normal, has_roughness):
-    if not uvs:
+    if not len(uvs):
         return False
 
-    unique_uvs = set(uv.to_tuple() for uv in uvs)
-    unique_ratio = len(unique_uvs) / len(uvs)
+    unique_ratio = unique_uv_ratio(uvs)
 
     return (
         utilization < 10.0 and
@@ -55,177 +84,80 @@ def is_color_atlas(obj, utilization, uvs, has_normal, has_roughness):
         not has_roughness
     )
 
-def calculate_uv_area(face, uv_layer):
-    uv_coords = [loop[uv_layer].uv for loop in face.loops]
-    if len(uv_coords) < 3:
-        return 0.0
-
-    area = 0.0
-    for i in range(1, len(uv_coords) -1):
-        a = uv_coords[0]
-        b = uv_coords[i]
-        c = uv_coords[i + 1]
-        area += abs((b - a).cross(c - a)) / 2.0
-
-    return area
-
-def get_island_texel_densities(obj):
-    if obj.type != 'MESH':
-        return 0.0, 0.0
-
-    mesh = obj.data
-    bm = bmesh.new()
-    bm.from_mesh(mesh)
-    uv_layer = bm.loops.layers.uv.active
-
+def get_uv_array(mesh):
+    uv_layer = mesh.uv_layers.active
     if not uv_layer:
-        bm.free()
-        return 0.0, 0.0
-
-    densities = []
-
-    for face in bm.faces:
-        face.select = True
-        face_area = face.calc_area()
-
-        uv_area = calculate_uv_area(face, uv_layer)
-
-        if face_area > 0:
-            density = uv_area / face_area
-            densities.append(density)
-
-        face.select = False
-
-    bm.free()
-
-    if not densities:
-        return 0.0, 0.0
-
-    avg_density = sum(densities) / len(densities)
-    deviation = max(abs(d - avg_density) for d in densities)
-    return avg_density, deviation
-
-def get_uv_utilization(obj):
+        return None
+    uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+    uv_layer.data.foreach_get("uv", uvs)
+    return uvs.reshape(-1, 2)
+
+def get_polygon_area_data(mesh):
+    face_count = len(mesh.polygons)
+    face_areas = np.empty(face_count, dtype=np.float32)
+    mesh.polygons.foreach_get("area", face_areas)
+    loop_starts = np.empty(face_count, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    loop_totals = np.empty(face_count, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    return face_areas, loop_starts, loop_totals
+
+UVStats = namedtuple("UVStats", ("uvs", "utilization", "overflow", "unique_ratio", "stacked"))
+
+def get_texel_density_stats(mesh, uvs):
+    if not len(uvs):
+        return 0.0, 0.0, 0.0, 0.0
+
+    face_areas, loop_starts, loop_totals = get_polygon_area_data(mesh)
+    uv_areas = polygon_uv_areas(uvs, loop_starts, loop_totals)
+    avg_density, deviation = texel_density_spread(uv_areas, face_areas)
+    return float(uv_areas.sum()), float(face_areas.sum(dtype=np.float64)), avg_density, deviation
+
+def get_uv_stats(obj, stacked_threshold=0.1):
+    # One read of the UV layer feeds every layout metric check_uvs needs; area data comes from
+    # get_texel_density_stats, only when the density is actually reported
     mesh = obj.data
-    bm = bmesh.new()
-    bm.from_mesh(mesh)
-
-    uv_layer = bm.loops.layers.uv.active
-    if not uv_layer:
-        bm.free()
-        return 0.0, False, []
-
-    uvs = []
-    min_u, min_v = 1.0, 1.0
-    max_u, max_v = 0.0, 0.0
-    overflow = False
-
-    try:
-        for face in bm.faces:
-            for loop in face.loops:
-                uv = loop[uv_layer].uv
-                uv_tuple = (uv.x, uv.y)
-                uvs.append(uv_tuple)
-
-                u, v = uv_tuple
-                min_u = min(min_u, u)
-                min_v = min(min_v, v)
-                max_u = max(max_u, u)
-                max_v = max(max_v, v)
-
-                if u < 0.0 or u > 1.0 or v < 0.0 or v > 1.0:
-                    overflow = True
-    except Exception as e:
-        print(f"UV read error: {e}")
-        bm.free()
-        return 0.0, False, []
-
-    bm.free()
+    uvs = get_uv_array(mesh)
+    if uvs is None or not len(mesh.polygons):
+        return UVStats(np.empty((0, 2), dtype=np.float32), 0.0, False, 0.0, False)
 
-    width = max_u - min_u
-    height = max_v - min_v
-    utilization = round(width * height * 100, 2) if uvs else 0.0
+    utilization, overflow = uv_utilization(uvs)
+    unique_ratio = unique_uv_ratio(uvs)
 
-    return utilization, overflow, uvs
+    return UVStats(uvs, utilization, overflow, unique_ratio, unique_ratio < stacked_threshold)
 
 def get_uv_bounds(uvs):
-    min_uv = Vector((min(uv.x for uv in uvs), min(uv.y for uv in uvs)))
-    max_uv = Vector((max(uv.x for uv in uvs), max(uv.y for uv in uvs)))
-    return min_uv, max_uv
+    uvs = np.asarray(uvs, dtype=np.float32).reshape(-1, 2)
+    return uvs.min(axis=0), uvs.max(axis=0)
 
 def get_all_objects_recursive(collection):
-    objs = list(collection.objects)
-    for child in collection.children:
-        objs.extend(get_all_objects_recursive(child))
+    # Explicit stack keeps the depth-first order of the recursive walk without a frame or list per level
+    objs = []
+    stack = [collection]
+    while stack:
+        col = stack.pop()
+        objs.extend(col.objects)
+        stack.extend(reversed(col.children))
     return objs
 
 def count_uv_islands(obj):
     mesh = obj.data
-    bm = bmesh.new()
-    bm.from_mesh(mesh)
-    uv_layer = bm.loops.layers.uv.active
-    if not uv_layer:
+    if not mesh.uv_layers.active:
         return 0
 
-    visited_faces = set()
-    islands = 0
-
-    for face in bm.faces:
-        if face in visited_faces:
-            continue
-
-        stack = [face]
-        connected = set()
-
-        while stack:
-            current = stack.pop()
-            if current in visited_faces:
-                continue
-            visited_faces.add(current)
-            connected.add(current)
+    loop_totals, loop_edges, _, _, edge_count = get_topology_data(mesh)
+    edge_seams = np.empty(edge_count, dtype=bool)
+    mesh.edges.foreach_get("use_seam", edge_seams)
+    return count_seam_islands(loop_edges, loop_totals, edge_seams)
 
-            for edge in current.edges:
-                if not edge.seam:
-                    for linked_face in edge.link_faces:
-                        if linked_face not in visited_faces:
-                            stack.append(linked_face)
-
-        if connected:
-            islands += 1
-    
-    bm.free()
-    return islands
-
-def get_total_uv_and_face_area(obj):
-    bm = bmesh.new()
-    bm.from_mesh(obj.data)
-    uv_layer = bm.loops.layers.uv.active
-
-    total_uv_area = 0.0
-    total_face_area =0.0
-    if uv_layer:
-        for face in bm.faces:
-            face_area = face.calc_area()
-            total_face_area += face_area
-            uv_area = calculate_uv_area(face, uv_layer)
-            total_face_area += uv_area
-
-    bm.free()
-    return total_uv_area, total_face_area
-
-def is_uv_layout_stacked(uvs, threshold=0.1):
-    if not uvs:
-        return False
-    unique_uvs = set((round(u, 5), round(v, 5)) for u, v in uvs)
-    return len(unique_uvs) / len(uvs) < threshold
-
-def dispatch_checks(obj, settings):
+def dispatch_checks(obj, settings, geometry=None, scan=None):
     from .checks import (
         check_geometry,
         check_object_modifiers,
         check_uvs,
         check_textures,
-        check_rigging
+        check_rigging,
+        scan_materials
     )
 
     report = []
@@ -234,37 +166,69 @@ def dispatch_checks(obj, settings):
         return []
 
     if obj.type == 'MESH':
-        report.extend(check_geometry(obj, settings))
-        report.extend(check_object_modifiers(obj))
-        report.extend(check_uvs(obj, multi_object_asset=(not settings.scan_single_object)))
-        report.extend(check_textures(obj))
+        if scan is None:
+            scan = scan_context(settings)
+        materials = scan_materials(obj, scan.image_nodes)
 
-        if has_armature(obj):
-            report.extend(check_rigging(obj))
+        with shared_bmesh(obj.data) as bm:
+            report.extend(check_geometry(obj, settings, geometry, bm))
+            report.extend(check_object_modifiers(obj))
+            report.extend(check_uvs(obj, multi_object_asset=(not settings.scan_single_object), materials=materials, scan=scan))
+            report.extend(check_textures(obj, materials=materials, scan=scan))
+
+            armature = get_armature(obj)
+            if armature:
+                report.extend(check_rigging(obj, armature, bm))
 
         return report
 
     return [("Other", f"Skipped unsupported type: {obj.type}", "INFO")]
 
+def section_report(flat_report):
+    sectioned = defaultdict(list)
+    for item in flat_report:
+        if isinstance(item, tuple) and len(item) == 3:
+            sectioned[section_for_label(item[0])].append(item)
+        else:
+            sectioned["Other"].append(item)
+    return dict(sectioned)
+
+def dispatch_checks_batch(objects, settings):
+    from .checks import prefetch_geometry
+
+    # Geometry is read a few objects ahead of the checks and the settings are read once for the whole batch
+    geometry = prefetch_geometry(objects) if len(objects) > 1 else ((obj, None) for obj in objects)
+    scan = scan_context(settings)
+    return {
+        obj.name: section_report(dispatch_checks(obj, settings, kernels, scan))
+        for obj, kernels in geometry
+    }
+
+# One C-level scan tells whether any alias occurs at all; most fallback labels then skip the ordered alias loop
+_ANY_ALIAS_RE = re.compile("|".join(map(re.escape, section_aliases)))
+_SECTION_ALIASES = tuple(section_aliases.items())
+_TEXTURE_PREFIXES = ("Texture", "Missing Texture Map", "Optional Maps", "Found Texture Maps")
+_UV_PREFIXES = ("Texel", "Unwrapping")
+_GEOMETRY_LABELS = frozenset({
+    "Vertex Count", "Face Count", "Edge Count", "N-gons", "Non-Manifold Edges",
+    "Stray Vertices", "Transforms Applied", "Unapplied Transforms", "Normals", "Double Vertices"
+})
+
+@functools.lru_cache(maxsize=4096)
 def infer_section_from_label(label: str) -> str:
-    for key, section in section_aliases.items():
-        if label.startswith(key) or key in label:
-            return section
-
-    if (
-        label.startswith("Texture")
-        or label.startswith("Missing Texture Map")
-        or label.startswith("Optional Maps")
-        or label.startswith("Found Texture Maps")
-        or "Resolution" in label
-        or "power-of-two" in label
-    ):
+    # A prefix is also a substring, so plain containment covers the old startswith-or-in pairs
+    if _ANY_ALIAS_RE.search(label):
+        for key, section in _SECTION_ALIASES:
+            if key in label:
+                return section
+
+    if label.startswith(_TEXTURE_PREFIXES) or "Resolution" in label or "power-of-two" in label:
         return "Textures"
 
-    if "Modifier" in label or label.startswith("Modifiers"):
+    if "Modifier" in label:
         return "Modifiers"
 
-    if "UV" in label or label.startswith("Texel") or label.startswith("Unwrapping"):
+    if "UV" in label or label.startswith(_UV_PREFIXES):
         return "UVs"
 
     if ("Bone" in label
@@ -275,42 +239,120 @@ def infer_section_from_label(label: str) -> str:
     ):
         return "Rigging"
     
-    if label in {
-        "Vertex Count", "Face Count", "Edge Count", "N-gons", "Non-Manifold Edges",
-        "Stray Vertices", "Transforms Applied", "Unapplied Transforms", "Normals", "Double Vertices"
-    }:
+    if label in _GEOMETRY_LABELS:
         return "Geometry"
   
     return "Other"
 
-def has_textures(obj) -> tuple[bool, int, list[tuple[str, str, str]]]:
-    found = False
-    packed_count = 0
-    unpacked_reports = []
-
-    for mat_slot in obj.material_slots:
-        mat = mat_slot.material
-        if not mat or not mat.use_nodes:
-            continue
-        for node in mat.node_tree.nodes:
-            if node.type == 'TEX_IMAGE' and node.image:
-                found = True
-                img = node.image
-                if img.packed_file is not None:
-                    packed_count += 1 
-                else:
-                    unpacked_reports.append(("Textures", f"External texture image ({img.name})", "ERROR"))
-    return found, packed_count, unpacked_reports
+@functools.lru_cache(maxsize=4096)
+def normalize_section(section: str) -> str:
+    cleaned = section.strip().rstrip(":")
+    cleaned = re.sub(r"\s*\(.*\)$", "", cleaned)
+    if cleaned in section_aliases:
+        return section_aliases[cleaned]
+    for key, alias in section_aliases.items():
+        if cleaned.startswith(key) or key in cleaned:
+            return alias
+    return section
+
+@functools.lru_cache(maxsize=4096)
+def section_for_label(label: str) -> str:
+    # Resolves a label straight to its canonical section with one cache probe per report item
+    return normalize_section(infer_section_from_label(label))
+
+def get_material_image_nodes(mat, cache=None):
+    # The cache belongs to one ScanContext and is keyed by pointer, so a material shared across
+    # assets is only walked once per scan and no node reference outlives the scan
+    key = mat.as_pointer()
+    nodes = cache.get(key) if cache is not None else None
+    if nodes is None:
+        if mat.use_nodes:
+            nodes = tuple(node for node in mat.node_tree.nodes if node.type == 'TEX_IMAGE' and node.image)
+        else:
+            nodes = ()
+        if cache is not None:
+            cache[key] = nodes
+    return nodes
+
+def get_check_executor():
+    global _check_executor
+    if _check_executor is None:
+        _check_executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+    return _check_executor
+
+def shutdown_check_executor():
+    global _check_executor
+    if _check_executor is not None:
+        _check_executor.shutdown(wait=True)
+        _check_executor = None
+
+def get_vertex_coords(mesh):
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    return coords.reshape(-1, 3)
+
+def get_topology_data(mesh):
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+    edge_verts = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edge_verts)
+    return loop_totals, loop_edges, edge_verts, len(mesh.vertices), len(mesh.edges)
+
+@contextmanager
+def shared_bmesh(mesh):
+    # One bmesh per object for every check that needs one; find_flipped_faces recalculates its
+    # normals in place, which leaves vertex and deform data untouched for later readers
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    try:
+        yield bm
+    finally:
+        bm.free()
 
 def ensure_object_mode():
     if bpy.context.mode != 'OBJECT':
         bpy.ops.object.mode_set(mode='OBJECT')
 
+@contextmanager
+def object_mode_guard():
+    # obj.mode gives the mode_set name ('EDIT', 'POSE', ...), unlike context.mode ('EDIT_MESH', ...)
+    active = bpy.context.active_object
+    previous = active.mode if active else 'OBJECT'
+    ensure_object_mode()
+    try:
+        yield
+    finally:
+        if previous != 'OBJECT' and bpy.context.active_object == active:
+            # A failed restore (e.g. the object was hidden meanwhile) must not discard the report or mask a check error
+            try:
+                bpy.ops.object.mode_set(mode=previous)
+            except RuntimeError as e:
+                print(f"Could not restore {previous} mode: {e}")
+
 def is_mesh(obj):
     return obj.type == 'MESH'
 
+def count_unassigned_vertices(mesh, bm=None):
+    owns_bm = bm is None
+    if owns_bm:
+        bm = bmesh.new()
+        bm.from_mesh(mesh)
+    deform_layer = bm.verts.layers.deform.active
+    if deform_layer is None:
+        unassigned = len(bm.verts)
+    else:
+        unassigned = sum(1 for v in bm.verts if not v[deform_layer])
+    if owns_bm:
+        bm.free()
+    return unassigned
+
+def get_armature(obj):
+    return next((mod.object for mod in obj.modifiers if mod.type == 'ARMATURE' and mod.object), None)
+
 def has_armature(obj) -> bool:
-    return any(mod.type == 'ARMATURE' and mod.object for mod in obj.modifiers)
+    return get_armature(obj) is not None
 
 def collection_has_armature(collection):
     return any(obj.type == 'ARMATURE' for obj in collection.objects)
@@ -319,7 +361,12 @@ def has_uvs(obj) -> bool:
     return obj.type == 'MESH' and bool(obj.data.uv_layers)
 
 def has_seams(obj) -> bool:
-    return obj.type == 'MESH' and any(edge.use_seam for edge in obj.data.edges)
+    if obj.type != 'MESH':
+        return False
+    edges = obj.data.edges
+    seams = np.empty(len(edges), dtype=bool)
+    edges.foreach_get("use_seam", seams)
+    return bool(seams.any())
 
 def aaa_mode() -> bool:
     return bpy.context.scene.ugame_settings.aaa_game_check
@@ -327,6 +374,15 @@ def aaa_mode() -> bool:
 def is_hero_asset() -> bool:
     return bpy.context.scene.ugame_settings.is_hero_asset
 
+# Scan-wide flags, read from the settings once instead of once per check per object, plus the
+# material image-node cache that lives exactly as long as the scan
+ScanContext = namedtuple("ScanContext", ("aaa", "hero", "image_nodes"))
+
+def scan_context(settings=None):
+    if settings is None:
+        return ScanContext(aaa_mode(), is_hero_asset(), {})
+    return ScanContext(settings.aaa_game_check, settings.is_hero_asset, {})
+
 def is_multi_object_asset(report_data, asset_collection_mode, active_object_mode):
     return len(report_data) > 1 and not asset_collection_mode and not active_object_mode
 
@@ -334,140 +390,53 @@ def is_multi_object_asset(report_data, asset_collection_mode, active_object_mode
 # # * Flipped Normals *
 # # *******************
 
-# # -----------------------------
-# # Utilities: islands and volume
-# # -----------------------------
+# # ---------
+# # Utilities
+# # ---------
 
 def _is_mesh(obj):
     return getattr(obj, "type", None) == "MESH"
 
-def _island_faces(bm):
-    islands = []
-    visited = set()
-    bm.faces.ensure_lookup_table()
-    for f in bm.faces:
-        if f.index in visited:
-            continue
-        stack = [f]
-        island =[]
-        while stack:
-            face = stack.pop()
-            if face.index in visited:
-                continue
-            visited.add(face.index)
-            island.append(face)
-            for e in face.edges:
-                for lf in e.link_faces:
-                    if lf.index not in visited:
-                        stack.append(lf)
-        islands.append(island)
-    return islands
-
-# # -------------------------
-# # Seed selection per island
-# # -------------------------
-
-def _select_seed_face(island):
-    verts = {v for f in island for v in f.verts}
-    if not verts:
-        return None
-    centroid = sum((v.co for v in verts), Vector((0.0, 0.0, 0.0))) / len(verts)
-    best, best_dot = None, -1.0
-    for f in island:
-        c = f.calc_center_median()
-        outward = (c - centroid)
-        if outward.length_squared == 0.0:
-            continue
-        outward.normalize()
-        d = f.normal.dot(outward)
-        if d > best_dot:
-            best, best_dot = f, d
-    return best
-
-def _propagate_consistency(island, inside=False):
-    flipped_local = set()
-    bm_local = bmesh.new()
-    vmap = {}
-    for f in island:
-        for v in f.verts:
-            if v.index not in vmap:
-                vmap[v.index] = bm_local.verts.new(v.co.copy())
-    bm_local.verts.ensure_lookup_table()
-
-    fmap = {}
-    for f in island:
-        new_face = bm_local.faces.new([vmap[v.index] for v in f.verts])
-        fmap[f.index] = new_face
-    bm_local.faces.ensure_lookup_table()
-    bm_local.normal_update()
-
-    adjacency = {f.index: set() for f in island}
-    for f in island:
-        for e in f.edges:
-            if len(e.link_faces) == 2:
-                f1, f2 = e.link_faces
-                adjacency[f1.index].add(f2.index)
-                adjacency[f2.index].add(f1.index)
-    
-    seed = _select_seed_face(island)
-    if seed is None:
-        bm_local.free()
-        return flipped_local
-
-    seed_local = fmap[seed.index]
-    bm_local.faces.ensure_lookup_table()
-    bm_local.normal_update()
-    seed_normal = seed_local.normal.copy()
-
-    if inside:
-        seed_normal.negate()
-
-    visited = set()
-    stack = [seed.index]
-    while stack:
-        idx = stack.pop()
-        if idx in visited:
-            continue
-        visited.add(idx)
-        f_local = fmap[idx]
-
-        if f_local.normal.dot(seed_normal) < 0:
-            f_local.normal_flip()
-            flipped_local.add(idx)
-            bm_local.normal_update()
-
-        for n_idx in adjacency[idx]:
-            if n_idx not in visited:
-                stack.append(n_idx)
-
-    bm_local.free()
-    return flipped_local
-
 # # ------------------------------
 # # Public API: find flipped faces
 # # ------------------------------
 
-def find_flipped_faces(obj, threshold=0.999):
+def find_flipped_faces(obj, threshold=0.999, sample_size=None, bm=None):
     if getattr(obj, "type", None) != "MESH":
         return []
 
-    bm = bmesh.new()
-    bm.from_mesh(obj.data)
-    bm.faces.ensure_lookup_table()
-    bm.normal_update()
+    mesh = obj.data
+    face_count = len(mesh.polygons)
+    if not face_count:
+        return []
 
-    current_status = {f.index: f.normal.copy() for f in bm.faces}
+    current_normals = np.empty(face_count * 3, dtype=np.float32)
+    mesh.polygons.foreach_get("normal", current_normals)
+    current_normals = current_normals.reshape(-1, 3)
 
+    # Recalculation needs the whole mesh, but only the sampled faces are read back and compared
+    indices = None
+    if sample_size and face_count > sample_size:
+        indices = np.sort(np.random.default_rng(0).choice(face_count, sample_size, replace=False))
+
+    owns_bm = bm is None
+    if owns_bm:
+        bm = bmesh.new()
+        bm.from_mesh(mesh)
+    bm.normal_update()
     bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
     bm.normal_update()
+    if indices is None:
+        new_normals = np.array([f.normal[:] for f in bm.faces], dtype=np.float32)
+    else:
+        bm.faces.ensure_lookup_table()
+        faces = bm.faces
+        new_normals = np.array([faces[i].normal[:] for i in indices.tolist()], dtype=np.float32)
+        current_normals = current_normals[indices]
+    if owns_bm:
+        bm.free()
 
-    new_status = {f.index: f.normal.copy() for f in bm.faces}
-
-    flipped = []
-    for idx, orig_normal in current_status.items():
-        dot = orig_normal.dot(new_status[idx])
-        if dot < threshold:
-            flipped.append(idx)
-
-    bm.free()
-    return flipped
\ No newline at end of file
+    flipped = flipped_face_indices(current_normals, new_normals, threshold)
+    if indices is not None:
+        flipped = indices[flipped]
+    return flipped.tolist()
@@ -24,14 +24,19 @@ import bpy.utils.previews
 import os
 
 custom_icons = None
+_ICONS_DIR = os.path.join(os.path.dirname(__file__), "icons")
 
 def register_icons():
     global custom_icons
+    # A second register without an unregister in between would otherwise leak the first collection
+    if custom_icons is not None:
+        return
     custom_icons = bpy.utils.previews.new()
-    icons_dir = os.path.join(os.path.dirname(__file__), "icons")
-    custom_icons.load("gamepad", os.path.join(icons_dir, "gamepad.png"), 'IMAGE')
+    custom_icons.load("gamepad", os.path.join(_ICONS_DIR, "gamepad.png"), 'IMAGE')
 
 def unregister_icons():
     global custom_icons
+    if custom_icons is None:
+        return
     bpy.utils.previews.remove(custom_icons)
     custom_icons = None
\ No newline at end of file
@@ -0,0 +1,208 @@
+'''
+Copyright (C) 2025 - Autotroph
+https://autotroph.com
+
+Created by Adrian Bellworthy
+
+This file is part of uGame.
+
+uGame is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 3
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, see https://www.gnu.org/licenses.
+'''
+
+
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components
+except ImportError:
+    # scipy isn't bundled with Blender's Python; the kernels below fall back to plain NumPy
+    cKDTree = None
+    connected_components = None
+
+# Pure NumPy kernels: these take arrays already read out of bpy and never touch bpy themselves
+
+def flipped_face_indices(current_normals, new_normals, threshold=0.999):
+    dots = np.einsum('ij,ij->i', current_normals, new_normals)
+    return np.flatnonzero(dots < threshold)
+
+def polygon_uv_areas(uvs, loop_starts, loop_totals):
+    # Shoelace formula per polygon; each polygon's loops are contiguous from its loop_start
+    if not len(loop_starts):
+        return np.zeros(0)
+    u = uvs[:, 0].astype(np.float64)
+    v = uvs[:, 1].astype(np.float64)
+    next_loops = np.arange(1, len(uvs) + 1)
+    next_loops[loop_starts + loop_totals - 1] = loop_starts
+    cross = u * v[next_loops] - u[next_loops] * v
+    return 0.5 * np.abs(np.add.reduceat(cross, loop_starts))
+
+def topology_counts(loop_totals, loop_edges, edge_verts, vert_count, edge_count):
+    ngons = int((loop_totals > 4).sum())
+
+    # An edge is manifold only when exactly two faces share it (matches BMEdge.is_manifold)
+    edge_face_counts = np.bincount(loop_edges, minlength=edge_count)
+    non_manifold = int((edge_face_counts != 2).sum())
+
+    linked = np.zeros(vert_count, dtype=bool)
+    linked[edge_verts] = True
+    stray_verts = int((~linked).sum())
+
+    return ngons, non_manifold, stray_verts
+
+# Odd 64-bit multipliers for the cell hash; cells that collide only add candidates the distance test rejects
+_CELL_HASH = np.array([0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9], dtype=np.uint64)
+
+# The cell itself plus the 13 neighbours on one side; the other 13 are covered when the roles swap
+_NEIGHBOUR_OFFSETS = np.array([(0, 0, 0)] + [
+    (x, y, z) for x in (-1, 0, 1) for y in (-1, 0, 1) for z in (-1, 0, 1) if (x, y, z) > (0, 0, 0)
+], dtype=np.int64)
+
+# Vertices in one cell above which coincident vertices are collapsed before the pair search
+_CROWDED_CELL = 64
+
+def _cell_hash(cells):
+    cells = cells.view(np.uint64)
+    return (cells[:, 0] * _CELL_HASH[0]) ^ (cells[:, 1] * _CELL_HASH[1]) ^ (cells[:, 2] * _CELL_HASH[2])
+
+def _sorted_cell_keys(cells):
+    # Row-major cell index when the padded grid fits in int64, so a neighbour cell is a constant key step away
+    # and sorted queries stay sorted; otherwise a hash, with each neighbour cell hashed on its own
+    cells = cells - (cells.min(axis=0) - 1)
+    dims = [int(n) + 2 for n in cells.max(axis=0)]
+    if dims[0] * dims[1] * dims[2] < 1 << 63:
+        strides = np.array([dims[1] * dims[2], dims[2], 1], dtype=np.int64)
+        keys = cells @ strides
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        return order, keys, [lambda step=int(offset @ strides): keys + step for offset in _NEIGHBOUR_OFFSETS]
+    keys = _cell_hash(cells)
+    order = np.argsort(keys, kind='stable')
+    keys, cells = keys[order], cells[order]
+    return order, keys, [lambda offset=offset: _cell_hash(cells + offset) for offset in _NEIGHBOUR_OFFSETS]
+
+def _partner_mask(points, threshold, chunk, collapse=True):
+    # Exact fixed-radius search: with threshold-sized cells, any pair within the threshold sits in the same
+    # or an adjacent cell, and every candidate pair gets a real distance test
+    order, sorted_keys, neighbours = _sorted_cell_keys(np.floor(points / threshold).astype(np.int64))
+
+    if collapse:
+        starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+        if np.diff(np.r_[starts, len(sorted_keys)]).max() > _CROWDED_CELL:
+            # Coincident vertices are partners outright; collapsing them keeps a stacked pile of vertices from
+            # turning into a quadratic number of candidate pairs
+            rows = np.ascontiguousarray(points).view(np.dtype((np.void, points.itemsize * 3))).ravel()
+            _, index, inverse, counts = np.unique(rows, return_index=True, return_inverse=True, return_counts=True)
+            unique_mask = _partner_mask(points[index], threshold, chunk, collapse=False)
+            return ((counts > 1) | unique_mask)[inverse.ravel()]
+
+    # Work in cell order so each cell's points are contiguous
+    points = points[order]
+    has_partner = np.zeros(len(points), dtype=bool)
+    limit = threshold * threshold
+
+    for neighbour_keys in neighbours:
+        queries = neighbour_keys()
+        lo = np.searchsorted(sorted_keys, queries, side='left')
+        found = np.searchsorted(sorted_keys, queries, side='right') - lo
+        ends = np.cumsum(found)
+        start = 0
+        while start < len(points) and ends[-1]:
+            # Blocks hold about `chunk` candidate pairs, so a crowded cell can't blow up memory
+            base = ends[start] - found[start]
+            stop = max(int(np.searchsorted(ends, base + chunk, side='right')), start + 1)
+            total = int(ends[stop - 1] - base)
+            if total:
+                block = found[start:stop]
+                rank = np.arange(total) - np.repeat(np.cumsum(block) - block, block)
+                first = np.repeat(np.arange(start, stop), block)
+                second = np.repeat(lo[start:stop], block) + rank
+                delta = points[first] - points[second]
+                close = (np.einsum('ij,ij->i', delta, delta) <= limit) & (first != second)
+                has_partner[first[close]] = True
+                has_partner[second[close]] = True
+            start = stop
+
+    mask = np.empty_like(has_partner)
+    mask[order] = has_partner
+    return mask
+
+def count_double_vertices(coords, threshold, chunk=1 << 16):
+    if not len(coords):
+        return 0
+    if cKDTree is not None:
+        pairs = cKDTree(coords).query_pairs(threshold, output_type='ndarray')
+        return len(np.unique(pairs)) // 2
+    # Same count as the KDTree: vertices with another vertex within the threshold, halved
+    return int(_partner_mask(np.asarray(coords, dtype=np.float64), threshold, chunk).sum()) // 2
+
+def unique_uv_ratio(uvs, precision=5):
+    if not len(uvs):
+        return 0.0
+    quantized = np.round(np.asarray(uvs, dtype=np.float64) * 10 ** precision).astype(np.int64)
+    keys = (quantized[:, 0] << 32) | (quantized[:, 1] & 0xffffffff)
+    return np.unique(keys).size / len(keys)
+
+def uv_utilization(uvs):
+    if not len(uvs):
+        return 0.0, False
+    # Bounds are clamped to include the 0-1 tile corner
+    min_u, min_v = np.minimum(uvs.min(axis=0), 1.0)
+    max_u, max_v = np.maximum(uvs.max(axis=0), 0.0)
+    overflow = bool(((uvs < 0.0) | (uvs > 1.0)).any())
+    utilization = round(float((max_u - min_u) * (max_v - min_v)) * 100, 2)
+    return utilization, overflow
+
+def texel_density_spread(uv_areas, face_areas):
+    valid = face_areas > 0
+    if not valid.any():
+        return 0.0, 0.0
+    densities = uv_areas[valid] / face_areas[valid]
+    avg_density = float(densities.mean())
+    deviation = float(np.abs(densities - avg_density).max())
+    return avg_density, deviation
+
+def count_connected_components(node_count, a, b):
+    if not node_count:
+        return 0
+    if connected_components is not None:
+        graph = coo_matrix((np.ones(len(a), dtype=np.int8), (a, b)), shape=(node_count, node_count))
+        count, _ = connected_components(graph, directed=False)
+        return int(count)
+
+    # Union-find by hooking roots to the lower label, then pointer jumping until stable
+    labels = np.arange(node_count)
+    while True:
+        previous = labels.copy()
+        root_a, root_b = labels[a], labels[b]
+        low = np.minimum(root_a, root_b)
+        np.minimum.at(labels, root_a, low)
+        np.minimum.at(labels, root_b, low)
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+        if np.array_equal(labels, previous):
+            return int((labels == np.arange(node_count)).sum())
+
+def count_seam_islands(loop_edges, loop_totals, edge_seams):
+    # Faces sharing a non-seam edge belong to the same island
+    loop_faces = np.repeat(np.arange(len(loop_totals)), loop_totals)
+    order = np.argsort(loop_edges, kind='stable')
+    edges = loop_edges[order]
+    faces = loop_faces[order]
+    linked = (edges[1:] == edges[:-1]) & ~edge_seams[edges[1:]]
+    return count_connected_components(len(loop_totals), faces[:-1][linked], faces[1:][linked])
@@ -29,6 +29,7 @@ from . import (
     config,
     icons
 )
+from .helpers import shutdown_check_executor
 
 def register():
     icons.register_icons()
@@ -40,4 +41,5 @@ def unregister():
     ui.unregister()
     operators.unregister()
     config.unregister()
-    icons.unregister_icons()
\ No newline at end of file
+    icons.unregister_icons()
+    shutdown_check_executor()
\ No newline at end of file
@@ -21,6 +21,7 @@ along with this program; if not, see https://www.gnu.org/licenses.
 '''
 
 import bpy
+import io
 from .utils import (
     is_high_poly,
     get_all_objects_in_collection,
@@ -33,13 +34,11 @@ from .report_utils import (
     open_report_in_new_window,
     format_collection_block,
     report_has_errors,
-    normalize_section
+    banner
 )
 from .helpers import (
-    dispatch_checks,
-    infer_section_from_label
+    object_mode_guard
 )
-from collections import defaultdict
 
 class OBJECT_OT_CheckGameReady(bpy.types.Operator):
     bl_idname = "object.check_game_ready"
@@ -49,7 +48,7 @@ class OBJECT_OT_CheckGameReady(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        report_lines = []
+        buf = io.StringIO()
         settings = context.scene.ugame_settings
         if settings.scan_selected_collection and not settings.selected_collection:
             self.report({'WARNING'}, "Please select a collection to scan.")
@@ -112,94 +111,82 @@ class OBJECT_OT_CheckGameReady(bpy.types.Operator):
             context.window_manager.modal_handler_add(self)
             return {'RUNNING_MODAL'}
 
-        mesh_objects = [obj for obj in objects_to_check if obj.type == 'MESH']
-        report_data = collect_report_data(mesh_objects, settings)
-
-        collection_utilization = None
-        if scan_collection and selected_collection:
-            uv_report = get_collection_uv_utilization(selected_collection)
-            for label, value, level in uv_report:
-                if "UV Space Utilization" in label and value:
-                    try:
-                        collection_utilization = float(str(value).strip("%"))
-                    except:
-                        pass
-
-        final_summary_text = build_final_summary(
-            report_data,
-            collection_utilization=collection_utilization,
-            asset_collection_mode=settings.asset_collection_mode,
-            active_object_mode=scan_single,
-            scan_collection=scan_collection,
-            scan_file=scan_file,
-            sel=selected_collection
-        )
-
-        # Report Header
-        title = "Game-Ready Check Report"
-        report_lines.append(f"\n{title}\n{'=' * len(title)}\n\n")
-        report_lines.append(f"Asset Type: {'Hero' if is_hero_asset else 'Background'}\n")
-        if scan_single:
-            scope_label = "Active Object Scan"
-        elif scan_file:
-            scope_label = "Full File Scan"
-        elif scan_collection:
-            scope_label = "Nested Collection Scan" if selected_collection.children else "Single Collection Scan"
-        else:
-            scope_label = "Unknown Scan Scope"
+        with object_mode_guard():
+            mesh_objects = [obj for obj in objects_to_check if obj.type == 'MESH']
+            report_data = collect_report_data(mesh_objects, settings)
+
+            collection_utilization = None
+            if scan_collection and selected_collection:
+                uv_report = get_collection_uv_utilization(selected_collection)
+                for label, value, level in uv_report:
+                    if "UV Space Utilization" in label and value:
+                        try:
+                            collection_utilization = float(str(value).strip("%"))
+                        except:
+                            pass
+
+            final_summary_text = build_final_summary(
+                report_data,
+                collection_utilization=collection_utilization,
+                asset_collection_mode=settings.asset_collection_mode,
+                active_object_mode=scan_single,
+                scan_collection=scan_collection,
+                scan_file=scan_file,
+                sel=selected_collection,
+                settings=settings
+            )
+
+            # Report Header
+            title = "Game-Ready Check Report"
+            buf.write(banner(title, leading="\n", overline=False))
+            buf.write(f"Asset Type: {'Hero' if is_hero_asset else 'Background'}\n")
+            if scan_single:
+                scope_label = "Active Object Scan"
+            elif scan_file:
+                scope_label = "Full File Scan"
+            elif scan_collection:
+                scope_label = "Nested Collection Scan" if selected_collection.children else "Single Collection Scan"
+            else:
+                scope_label = "Unknown Scan Scope"
 
-        report_lines.append(f"Scope: {scope_label}\n")
+            buf.write(f"Scope: {scope_label}\n")
 
-        # Final Summary
-        title = "[FINAL SUMMARY]"
-        report_lines.append(f"\n\n{'=' * len(title)}\n{title}\n{'=' * len(title)}\n\n")
-        has_errors = report_has_errors(report_data, asset_collection_mode=settings.asset_collection_mode, active_object_mode=scan_single)
-        if has_errors:
-            report_lines.append("Overall Game-Ready Status: FAIL\n\n")
-        else:
-            report_lines.append("Overall Game-Ready Status: PASS")
+            # Final Summary
+            title = "[FINAL SUMMARY]"
+            buf.write(banner(title))
+            has_errors = report_has_errors(report_data, asset_collection_mode=settings.asset_collection_mode, active_object_mode=scan_single)
+            if has_errors:
+                buf.write("Overall Game-Ready Status: FAIL\n\n")
+            else:
+                buf.write("Overall Game-Ready Status: PASS")
 
-        report_lines.append(final_summary_text + "\n")
+            buf.write(final_summary_text + "\n")
             
 
-        # Excluded Objects
-        title = "[Excluded Objects]"
-        if excluded_objects:
-            report_lines.append(f"\n\n{'=' * len(title)}\n{title}\n{'=' * len(title)}\n\n")
-            for name in excluded_objects:
-                report_lines.append(f"- {name} (high-poly)\n")
-
-        # Collection Structure
-        title = "[Collection Structure]"
-        if scan_collection and selected_collection:
-            report_lines.append(f"\n\n{'=' * len(title)}\n{title}\n{'=' * len(title)}\n\n")
-            report_lines.extend(format_collection_block(selected_collection))
-            for child in selected_collection.children:
-                report_lines.append("\n")
-                report_lines.extend(format_collection_block(child))
-
-        # Per-object detail
-        title = "[Per-Object Detail]"
-        report_lines.append(f"\n\n{'=' * len(title)}\n{title}\n{'=' * len(title)}\n")
-        settings = context.scene.ugame_settings
-        for obj in mesh_objects:
-            flat_report = dispatch_checks(obj, settings)
-            sectioned = defaultdict(list)
-
-            for item in flat_report:
-                if isinstance(item, tuple) and len(item) == 3:
-                    label, value, level = item
-                    raw_section = infer_section_from_label(label)
-                    section = normalize_section(raw_section)
-                    sectioned[section].append((label, value, level))
-                else:
-                    sectioned["Other"].append(item)
-
-            obj_sections = dict(sectioned)
-            report_lines.extend(build_per_object_detail(obj.name, obj_sections, settings))
+            # Excluded Objects
+            title = "[Excluded Objects]"
+            if excluded_objects:
+                buf.write(banner(title))
+                for name in excluded_objects:
+                    buf.write(f"- {name} (high-poly)\n")
+
+            # Collection Structure
+            title = "[Collection Structure]"
+            if scan_collection and selected_collection:
+                buf.write(banner(title))
+                buf.writelines(format_collection_block(selected_collection))
+                for child in selected_collection.children:
+                    buf.write("\n")
+                    buf.writelines(format_collection_block(child))
+
+            # Per-object detail
+            title = "[Per-Object Detail]"
+            buf.write(banner(title, "\n"))
+            for obj_name, obj_sections in report_data.items():
+                buf.writelines(build_per_object_detail(obj_name, obj_sections, settings))
 
         # Output
-        report_text = "".join(report_lines)
+        report_text = buf.getvalue()
         open_report_in_new_window(report_text)
         self.report({'INFO'}, "Game-Ready report opened in new Text Editor window")
         return {'FINISHED'}
@@ -22,25 +22,21 @@ along with this program; if not, see https://www.gnu.org/licenses.
 
 import bpy
 import os
-import re
+import functools
 from collections import defaultdict
 from .checks import (
     check_collection_structure,
     check_collection_transforms
 )
-from .constants import (
-    section_aliases
-)
 
 from .utils import (
     get_collection_uv_utilization,
 )
 from .helpers import (
-    dispatch_checks,
-    infer_section_from_label,
+    dispatch_checks_batch,
+    normalize_section,
     has_uvs,
     has_seams,
-    ensure_object_mode,
     is_mesh,
     has_armature,
     collection_has_armature,
@@ -51,15 +47,16 @@ from .texture_checks import (
     get_clean_map_type,
     get_clean_name
 )
-def normalize_section(section: str) -> str:
-    cleaned = section.strip().rstrip(":")
-    cleaned = re.sub(r"\s*\(.*\)$", "", cleaned)
-    if cleaned in section_aliases:
-        return section_aliases[cleaned]
-    for key, alias in section_aliases.items():
-        if cleaned.startswith(key) or key in cleaned:
-            return alias
-    return section
+_EXPECTED_SECTIONS = ("Geometry", "Modifiers", "Rigging", "UVs", "Textures")
+_SECTION_RULES = {s: "-" * (len(s) + 2) for s in _EXPECTED_SECTIONS}
+_SECTION_HEADINGS = {s: f"\n[{s}]\n{rule}\n" for s, rule in _SECTION_RULES.items()}
+
+@functools.lru_cache(maxsize=None)
+def banner(title, trailing="\n\n", leading="\n\n", overline=True):
+    rule = "=" * len(title)
+    if overline:
+        return f"{leading}{rule}\n{title}\n{rule}{trailing}"
+    return f"{leading}{title}\n{rule}{trailing}"
 
 def build_asset_summary_line(category, issues, status="FAIL", width=150):
     prefix = f"ASSET : {category} | {status} ("
@@ -99,21 +96,30 @@ def extract_errors(section_items, group_by_label=False, prefix_filter=None):
     return sorted(results)
 
 def collect_report_data(objects, settings):
-    report_data = {}
-    for obj in objects:
-        flat_report = dispatch_checks(obj, settings)
-        sectioned = defaultdict(list)
+    return dispatch_checks_batch(objects, settings)
+
+_TEXTURE_REASON_ORDER = (
+    "Missing Texture Map",
+    "Texture name invalid",
+    "Contains disallowed term",
+    "Missing required suffix",
+    "Not power-of-two",
+    "Resolution too high for background asset",
+    "Resolution too low for Hero Asset",
+    "Very low resolution"
+)
 
-        for item in flat_report:
-            if isinstance(item, tuple) and len(item) == 3:
-                label, value, level = item
-                raw_section = infer_section_from_label(label)
-                section = normalize_section(raw_section)
-                sectioned[section].append((label, value, level))
-            else:
-                sectioned["Other"].append(item)
-        report_data[obj.name] = dict(sectioned)
-    return report_data
+def format_texture_summaries(grouped):
+    summaries = []
+    for reason in _TEXTURE_REASON_ORDER:
+        if reason in grouped:
+            summaries.append(f"{reason}: {', '.join(sorted(set(grouped[reason])))}")
+
+    for reason, maps in grouped.items():
+        if reason not in _TEXTURE_REASON_ORDER:
+            summaries.append(f"{reason}: {', '.join(sorted(set(maps)))}")
+
+    return summaries
 
 def summarize_texture_errors(items):
     grouped = {}
@@ -125,28 +131,22 @@ def summarize_texture_errors(items):
         grouped.setdefault(reason, []).append(map_name)
         total_maps += 1
 
-    order = [
-        "Missing Texture Map",
-        "Texture name invalid",
-        "Contains disallowed term",
-        "Missing required suffix",
-        "Not power-of-two",
-        "Resolution too high for background asset",
-        "Resolution too low for Hero Asset",
-        "Very low resolution"
-    ]
-
-    summaries = []
-    for reason in order:
-        if reason in grouped:
-            maps = grouped[reason]
-            summaries.append(f"{reason}: {', '.join(sorted(set(maps)))}")
+    return format_texture_summaries(grouped), total_maps
 
-    for reason, maps in grouped.items():
-        if reason not in order:
-            summaries.append(f"{reason}: {', '.join(sorted(set(maps)))}")
-
-    return summaries, total_maps
+def scan_section_items(items, section):
+    # One walk feeds the flat, label-grouped and texture views of a section's errors
+    grouped = {}
+    flat = []
+    for label, value, level in items:
+        if level == "ERROR":
+            grouped.setdefault(label, []).append(value)
+            flat.append(format_error(label, value))
+
+    if section == "Modifiers":
+        errors = [f"{label}: ({', '.join(sorted(set(values)))})" for label, values in grouped.items()]
+    else:
+        errors = sorted(flat)
+    return errors, grouped, len(flat)
 
 def build_final_summary(report_data,
                         asset_collection_mode=False,
@@ -155,10 +155,12 @@ def build_final_summary(report_data,
                         scan_file=False,
                         collection_utilization=None,
                         sel=None,
-                        width=100):
+                        width=100,
+                        settings=None):
     summary_lines = []
-    target = 90.0 if aaa_mode() else 80.0
-    pass_threshold = 85.0 if aaa_mode() else 70.0
+    aaa = settings.aaa_game_check if settings is not None else aaa_mode()
+    target = 90.0 if aaa else 80.0
+    pass_threshold = 85.0 if aaa else 70.0
     multi = is_multi_object_asset(report_data, asset_collection_mode, active_object_mode)
 
     def format_section(section, errors, width, indent):
@@ -224,17 +226,14 @@ def build_final_summary(report_data,
         summary_lines.append("")
 
     for obj_name, issues in report_data.items():
-        obj_errors = []
-        for section, items in issues.items():
-            obj_errors.extend(extract_errors(items))
-        if not obj_errors:
+        if not any(level == "ERROR" for items in issues.values() for _, _, level in items):
             continue
         
         summary_lines.append(f"OBJECT : {obj_name}")
         indent = " " * 8
 
         for section, items in issues.items():
-            errors = extract_errors(items, group_by_label=True if section == "Modifiers" else False)
+            errors, grouped, total_maps = scan_section_items(items, section)
             if not errors and section not in ("Modifiers", "Textures"):
                 continue
 
@@ -252,7 +251,7 @@ def build_final_summary(report_data,
                     
             elif section == "Textures":
                 if errors:
-                    summaries, total_maps = summarize_texture_errors(items)
+                    summaries = format_texture_summaries(grouped)
                     if summaries:
                         prefix = f"[Textures ({total_maps})], "
                         for i, summary in enumerate(summaries):
@@ -272,22 +271,12 @@ def build_final_summary(report_data,
     
     return "\n".join(summary_lines)
 
-def build_detailed_report(objects):
+def build_detailed_report(objects, settings=None):
+    if settings is None:
+        settings = bpy.context.scene.ugame_settings
     lines = ["\n\n[Per-Object Detail]\n==================="]
-    for obj in objects:
-        flat_report = dispatch_checks(obj, bpy.context.scene.ugame_settings)
-        sectioned = defaultdict(list)
-        for item in flat_report:
-            if isinstance(item, tuple) and len(item) == 3:
-                label, value, level = item
-                raw_section = infer_section_from_label(label)
-                section = normalize_section(raw_section)
-                sectioned[section].append((label, value, level))
-            else:
-                sectioned["Other"].append(item)
-        obj_sections = dict(sectioned)
-        detail_lines = build_per_object_detail(obj.name, obj_sections)
-        lines.extend(detail_lines)
+    for obj_name, obj_sections in dispatch_checks_batch(objects, settings).items():
+        lines.extend(build_per_object_detail(obj_name, obj_sections, settings))
     return "\n".join(lines)
 
 def build_per_object_detail(obj_name, obj_sections, settings=None):
@@ -299,11 +288,10 @@ def build_per_object_detail(obj_name, obj_sections, settings=None):
     for raw_section, items in obj_sections.items():
         normalized = normalize_section(raw_section)
         normalized_sections[normalized].extend(items)
-    expected_sections = ["Geometry", "Modifiers", "Rigging", "UVs", "Textures"]
 
-    for section in expected_sections:
+    for section in _EXPECTED_SECTIONS:
         items = normalized_sections.get(section, [])
-        lines.append(f"\n[{section}]\n{'-' * len(section) + '--'}\n")
+        lines.append(_SECTION_HEADINGS[section])
 
         if not items:
             lines.append(f"[INFO] No data returned for {section} - check may not apply to this object\n")
@@ -377,11 +365,10 @@ def open_report_in_new_window(report_text):
 
 def report_has_errors(report_data, asset_collection_mode=False, active_object_mode=False):
     multi = is_multi_object_asset(report_data, asset_collection_mode, active_object_mode)
-    for obj_issues in report_data.values():
-        for section, section_items in obj_issues.items():
-            for label, value, level in section_items:
-                if level == "ERROR":
-                    if multi and section == "UVs" and "UV Space Utilization" in label:
-                        continue
-                    return True
-    return False
\ No newline at end of file
+    # Per-object UV utilization is judged at collection level for multi-object assets
+    return any(
+        level == "ERROR" and not (multi and section == "UVs" and "UV Space Utilization" in label)
+        for obj_issues in report_data.values()
+        for section, section_items in obj_issues.items()
+        for label, value, level in section_items
+    )
@@ -22,7 +22,7 @@ along with this program; if not, see https://www.gnu.org/licenses.
 
 import os
 import re
-import fnmatch
+import functools
 from .helpers import (
     is_hero_asset
 )
@@ -31,29 +31,41 @@ from .constants import (
     valid_prefixes,
     required_maps,
     optional_maps,
-    banned_patterns
+    BANNED_RE,
+    MAP_TYPE_BY_SUFFIX,
+    MAP_PRIORITY,
+    MAP_SUFFIX_LENGTHS
 )
 
+_RESOLUTION_SUFFIX_RE = re.compile(r'[-_]?\d{3,5}x\d{3,5}$')
+
+@functools.lru_cache(maxsize=4096)
 def infer_map_type(name_clean):
+    # One dict probe per suffix length; the earliest map type in rule order wins, as with a linear scan
     token = normalize_token(name_clean)
-    for map_type, suffixes in required_maps.items():
-        for suffix in suffixes:
-            if token.endswith(suffix):
-                # print("Matched", map_type, "with suffix", suffix, "for token", token)
-                return map_type
-    for map_type, suffixes in optional_maps.items():
-        for suffix in suffixes:
-            if token.endswith(suffix):
-                # print("Matched", map_type, "with suffix", suffix, "for token", token)
-                return map_type
-    return None
+    matched = None
+    for length in MAP_SUFFIX_LENGTHS:
+        if length > len(token):
+            break
+        map_type = MAP_TYPE_BY_SUFFIX.get(token[-length:])
+        if map_type and (matched is None or MAP_PRIORITY[map_type] < MAP_PRIORITY[matched]):
+            matched = map_type
+    return matched
+
+@functools.lru_cache(maxsize=1024)
+def get_clean_name_from_name(name):
+    name_raw = os.path.splitext(name)[0]
+    return _RESOLUTION_SUFFIX_RE.sub('', name_raw).lower()
+
+@functools.lru_cache(maxsize=1024)
+def get_clean_map_type_from_name(name):
+    return infer_map_type(get_clean_name_from_name(name))
 
 def get_clean_name(img):
-    name_raw = os.path.splitext(img.name)[0]
-    return re.sub(r'[-_]?\d{3,5}x\d{3,5}$', '', name_raw).lower()
+    return get_clean_name_from_name(img.name)
 
 def get_clean_map_type(img):
-    return infer_map_type(get_clean_name(img))
+    return get_clean_map_type_from_name(img.name)
 
 def detect_map_type_from_node(node):
     if node.type == 'TEX_IMAGE':
@@ -77,9 +89,7 @@ def check_texture_naming(img, strict):
     token = normalize_token(name_clean)
     map_type = infer_map_type(name_clean)
 
-    all_suffixes = set().union(*required_maps.values(), *optional_maps.values())
-    has_valid_suffix = any(token.endswith(suffix) for suffix in all_suffixes)
-    if not has_valid_suffix:
+    if map_type is None:
         report.append(("Texture name invalid", img.name, "ERROR"))
 
     if map_type:
@@ -93,7 +103,7 @@ def check_texture_naming(img, strict):
                 if not any(token.endswith(suffix) for suffix in suffixes):
                     report.append(("Missing optional suffix", mt, "WARNING"))
 
-    if any(fnmatch.fnmatch(name_lower, pattern) for pattern in banned_patterns):
+    if BANNED_RE.match(name_lower):
         report.append(("Contains disallowed term", name, "ERROR"))
 
     if strict and not any(name.startswith(prefix) for prefix in valid_prefixes):
@@ -102,16 +112,18 @@ def check_texture_naming(img, strict):
     # print("suffixes for Roughness:", required_maps["Roughness"])
     return report
 
-def check_texture_resolution(img):
+def check_texture_resolution(img, hero=None):
     report = []
     w, h = img.size
     min_dim = min(w, h)
+    if hero is None:
+        hero = is_hero_asset()
 
     if min_dim < 256:
         report.append((f"Very low resolution ({w}x{h})", f"{img.name}", "ERROR"))
-    elif is_hero_asset() and min_dim < 2048:
+    elif hero and min_dim < 2048:
         report.append((f"Resolution too low for Hero Asset ({w}x{h})", f"{img.name}", "ERROR"))
-    elif not is_hero_asset() and min_dim > 1024:
+    elif not hero and min_dim > 1024:
         report.append((f"Resolution too high for background Asset ({w}x{h})", f"{img.name}", "ERROR"))
     elif min_dim < 512:
         report.append((f"Low resolution ({w}x{h})", f"{img.name}", "WARNING"))
@@ -125,14 +137,5 @@ def check_texture_resolution(img):
     return report
 
 def is_node_connected(node):
-    visited = set()
-    to_visit = list(node.outputs)
-
-    while to_visit:
-        socket = to_visit.pop()
-        for link in socket.links:
-            target_node = link.to_node
-            if target_node not in visited:
-                visited.add(target_node)
-                to_visit.extend(target_node.outputs)
-    return bool(visited)
\ No newline at end of file
+    # Only whether any output is linked matters, so there is no need to walk the downstream graph
+    return any(socket.is_linked for socket in node.outputs)
@@ -59,6 +59,7 @@ class OBJECT_OT_GameReadyPopup(bpy.types.Operator):
         box.prop(settings, "asset_collection_mode")
         box.prop(settings, "aaa_game_check")
         box.prop(settings, "is_hero_asset", text="Hero Asset")
+        box.prop(settings, "sample_large_meshes")
         box.prop(settings, "scan_mode")
         if settings.scan_selected_collection:
             box.prop(settings, "selected_collection")
@@ -21,8 +21,10 @@ along with this program; if not, see https://www.gnu.org/licenses.
 '''
 
 import bpy
+import numpy as np
 from .helpers import (
-    get_uv_bounds
+    get_uv_bounds,
+    get_uv_array
 )
 from .checks import (
     check_geometry,
@@ -90,18 +92,16 @@ def get_collection_uv_utilization(collection):
     for obj in collection.objects:
         if obj.type != 'MESH':
             continue
-        mesh = obj.data
-        uv_layer = mesh.uv_layers.active
-        if not uv_layer:
-            continue
-        all_uvs.extend([loop.uv.copy() for loop in uv_layer.data])
+        uvs = get_uv_array(obj.data)
+        if uvs is not None and len(uvs):
+            all_uvs.append(uvs)
 
     if not all_uvs:
         report.append(("UV Space Utilization", "No UVs found", "WARNING"))
         return report
 
-    min_uv , max_uv = get_uv_bounds(all_uvs)
-    uv_area = (max_uv.x - min_uv.x) * (max_uv.y - min_uv.y)
+    min_uv, max_uv = get_uv_bounds(np.concatenate(all_uvs))
+    uv_area = float((max_uv[0] - min_uv[0]) * (max_uv[1] - min_uv[1]))
     utilization = round(uv_area * 100, 2)
 
     level = "INFO" if utilization >= 90 else "WARNING"